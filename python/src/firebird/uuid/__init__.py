@@ -38,5 +38,6 @@
 """
 
 from ._model import NodeType, Node, IANA_ROOT_NAME
-from ._spec import get_specification, get_specifications, parse_specifications, ROOT_SPEC
+from ._spec import (get_specification, get_specifications, parse_specifications,
+                    clear_parse_cache, ROOT_SPEC)
 from ._registry import oid_registry, OIDRegistry
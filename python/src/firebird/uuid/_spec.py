@@ -65,60 +65,37 @@ Each file has the following format::
 """
 
 from __future__ import annotations
-from typing import Tuple, Dict, Set
+from typing import Any, Tuple, Dict, List, Set, FrozenSet, Optional
 import os
 import re
+import json
+import threading
+from hashlib import blake2b
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from pathlib import Path
+from urllib.parse import urlparse
 from urllib.request import url2pathname
 import requests
 import yaml
+from .__about__ import __version__
 
-KeySet = Set[str]
+KeySet = FrozenSet[str]
 
-class LocalFileAdapter(requests.adapters.BaseAdapter):
-    """Protocol Adapter to allow Requests to GET file:// URLs
-    """
-    @staticmethod
-    def _chkpath(method, path):
-        """Return an HTTP status for the given filesystem path."""
-        if method.lower() in ('put', 'delete'):
-            return 501, "Not Implemented"  # TODO
-        elif method.lower() not in ('get', 'head'):
-            return 405, "Method Not Allowed"
-        elif os.path.isdir(path):
-            return 400, "Path Not A File"
-        elif not os.path.isfile(path):
-            return 404, "File Not Found"
-        elif not os.access(path, os.R_OK):
-            return 403, "Access Denied"
-        else:
-            return 200, "OK"
-
-    def send(self, req, **kwargs):  # pylint: disable=unused-argument
-        """Return the file specified by the given request
-        """
-        path = os.path.normcase(os.path.normpath(url2pathname(req.path_url)))
-        response = requests.Response()
-
-        response.status_code, response.reason = self._chkpath(req.method, path)
-        if response.status_code == 200 and req.method.lower() != 'head':
-            try:
-                response.raw = open(path, 'rb')
-            except (OSError, IOError) as err:
-                response.status_code = 500
-                response.reason = str(err)
-
-        if isinstance(req.url, bytes):
-            response.url = req.url.decode('utf-8')
-        else:
-            response.url = req.url
+#: YAML loader; libyaml-based `CSafeLoader` when PyYAML is built with libyaml
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
-        response.request = req
-        response.connection = self
+#: Per-thread HTTP sessions used to fetch OID specifications (requests sessions are not
+#: guaranteed to be thread-safe)
+_thread_data = threading.local()
 
-        return response
-
-    def close(self):
-        pass
+def _get_session() -> requests.Session:
+    """Returns HTTP session for current thread, created on first use, so connections are
+    kept alive and reused by subsequent fetches.
+    """
+    session = getattr(_thread_data, 'session', None)
+    if session is None:
+        session = _thread_data.session = requests.Session()
+    return session
 
 #: URL for ROOT specification
 ROOT_SPEC = 'https://raw.githubusercontent.com/FirebirdSQL/firebird-uuid/master/root.oid'
@@ -139,17 +116,101 @@ ITEM_NUMBER = 'number'
 #KEY_ITEMS = (ITEM_OID, ITEM_NAME, ITEM_DESCRIPTION, ITEM_CONTACT, ITEM_EMAIL, ITEM_SITE,
              #ITEM_TYPE, ITEM_NODE_SPEC)
 
-SPEC_ITEMS: KeySet = set((ITEM_NODE, ITEM_CHILDREN))
-NODE_ITEMS: KeySet = set((ITEM_OID, ITEM_NAME, ITEM_DESCRIPTION, ITEM_CONTACT, ITEM_EMAIL,
-                          ITEM_SITE, ITEM_PARENT_SPEC, ITEM_TYPE))
-CHILD_ITEMS: KeySet = set((ITEM_NUMBER, ITEM_NAME, ITEM_DESCRIPTION, ITEM_CONTACT, ITEM_EMAIL,
-                           ITEM_SITE, ITEM_NODE_SPEC))
+SPEC_ITEMS: KeySet = frozenset((ITEM_NODE, ITEM_CHILDREN))
+NODE_ITEMS: KeySet = frozenset((ITEM_OID, ITEM_NAME, ITEM_DESCRIPTION, ITEM_CONTACT, ITEM_EMAIL,
+                                ITEM_SITE, ITEM_PARENT_SPEC, ITEM_TYPE))
+CHILD_ITEMS: KeySet = frozenset((ITEM_NUMBER, ITEM_NAME, ITEM_DESCRIPTION, ITEM_CONTACT, ITEM_EMAIL,
+                                 ITEM_SITE, ITEM_NODE_SPEC))
 
 RE_EMAIL = re.compile(r"""(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9]))\.){3}(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9])|[a-z0-9-]*[a-z0-9]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])""")
 RE_OID = re.compile(r"^(\d+\.)+\d+$")
 RE_NAME = re.compile(r"^[a-zA-Z0-9_\-]+$")
-TYPE_VALUES = ('root', 'node', 'leaf')
-NODE_KEYWORDS = ('private', 'leaf')
+TYPE_VALUES: KeySet = frozenset(('root', 'node', 'leaf'))
+NODE_KEYWORDS: KeySet = frozenset(('private', 'leaf'))
+
+_PYTHONIZE_TABLE = str.maketrans('-', '_')
+
+def _digest(value: str) -> bytes:
+    """Returns digest of specification text or URL used as cache key.
+    """
+    return blake2b(value.encode('utf-8'), digest_size=16).digest()
+
+def _get_cache_dir() -> Optional[Path]:
+    """Returns directory for on-disk cache of fetched and parsed specifications, or None
+    if cache is not enabled.
+
+    The cache is enabled by setting `FIREBIRD_UUID_CACHE` environment variable to `1`,
+    and is located in `firebird-uuid/<package version>` subdirectory of `XDG_CACHE_HOME`
+    (`~/.cache` when not set).
+    """
+    if os.environ.get('FIREBIRD_UUID_CACHE') != '1':
+        return None
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'firebird-uuid' / __version__
+
+def _write_cache(cache_file: Path, data: Any) -> None:
+    """Stores data as JSON into cache file. Errors are ignored.
+    """
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.{threading.get_ident()}')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError):
+        pass
+
+def _read_cache(cache_file: Path) -> Any:
+    """Returns data from JSON cache file, or None if file does not exist or could not
+    be read.
+    """
+    try:
+        return json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+#: Parsed YAML documents, keyed by BLAKE2 digest of the document text
+_YAML_CACHE: Dict[bytes, Any] = {}
+#: Maximum number of documents kept in `_YAML_CACHE`
+_YAML_CACHE_SIZE = 256
+#: Lock that guards `_YAML_CACHE`
+_YAML_CACHE_LOCK = threading.Lock()
+
+def _load_yaml(spec: str) -> Any:
+    """Returns parsed YAML document.
+
+    Parsed documents are cached by content, so specification loaded during tree traversal
+    is not parsed again by `.parse_specifications()`. Returned data are shared and must
+    not be modified.
+
+    Arguments:
+      spec: YAML document.
+    """
+    key = _digest(spec)
+    with _YAML_CACHE_LOCK:
+        data = _YAML_CACHE.get(key)
+    if data is None:
+        data = yaml.load(spec, Loader=_YamlLoader)
+        with _YAML_CACHE_LOCK:
+            while len(_YAML_CACHE) >= _YAML_CACHE_SIZE:
+                del _YAML_CACHE[next(iter(_YAML_CACHE))]
+            _YAML_CACHE[key] = data
+    return data
+
+def _forget_yaml(spec: str) -> None:
+    """Removes parsed YAML document from cache.
+
+    Arguments:
+      spec: YAML document.
+    """
+    key = _digest(spec)
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE.pop(key, None)
+
+def clear_parse_cache() -> None:
+    """Clears in-memory cache of parsed YAML specifications.
+    """
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE.clear()
 
 def _check_string(data: Dict, item: str) -> None:
     value = data[item]
@@ -218,10 +279,10 @@ def validate_dict(expected: KeySet, data: Dict[str, str]) -> None:
       ValueError: When any keys are missing or additional keys are present, or when
         values do not conform to specification.
     """
-    given = set(data.keys())
+    given = data.keys()
     if expected != given:
-        missing = expected.difference(given)
-        additional = given.difference(expected)
+        missing = expected - given
+        additional = given - expected
         if missing and not additional:
             raise ValueError(f'Missing keys: {", ".join(missing)}')
         elif additional and not missing:
@@ -255,10 +316,10 @@ def pythonize(data: Dict) -> Dict:
     Arguments:
       data: Dictionary for normalization.
     """
-    result = {key.replace('-', '_'): value for key, value in data.items()}
-    if 'type' in result:
-        result['node_type'] = result['type']
-        del result['type']
+    result = {key.translate(_PYTHONIZE_TABLE): value for key, value in data.items()
+              if key != ITEM_TYPE}
+    if ITEM_TYPE in data:
+        result['node_type'] = data[ITEM_TYPE]
     return result
 
 def pythonize_spec(data: Dict) -> Dict:
@@ -268,27 +329,53 @@ def pythonize_spec(data: Dict) -> Dict:
     Arguments:
       data: Dictionary for normalization.
     """
-    result = {}
-    result['node'] = pythonize(data['node'])
-    for i, child in enumerate(data['children']):
-        result['children'][i] = pythonize(child)
-    return result
+    return {ITEM_NODE: pythonize(data[ITEM_NODE]),
+            ITEM_CHILDREN: [pythonize(child) for child in data[ITEM_CHILDREN]],
+            }
 
 def get_specification(url: str) -> str:
     """Returns YAML text of OID specification from URL.
 
+    Specifications with `file://` URL are read directly from local file system.
+
+    When on-disk cache is enabled (see `.parse_specifications()`), the specification is
+    fetched with conditional GET using `ETag` / `Last-Modified` of the cached copy, and
+    the cached text is returned when server reports it as not modified.
+
     Arguments:
         url: URL of OID specification.
 
     Raises:
       requests.HTTPError: If one occurred.
+      OSError: If local specification file could not be read.
     """
-    requests_session = requests.session()
-    requests_session.mount('file://', LocalFileAdapter())
-
-    spec_req: requests.Response = requests_session.get(url, allow_redirects=True)
+    parsed_url = urlparse(url)
+    if parsed_url.scheme.lower() == 'file':
+        return Path(url2pathname(parsed_url.path)).read_text(encoding='utf-8')
+    cache_file: Optional[Path] = None
+    cached: Optional[Dict] = None
+    headers: Dict[str, str] = {}
+    cache_dir = _get_cache_dir()
+    if cache_dir is not None:
+        cache_file = cache_dir / 'http' / f'{_digest(url).hex()}.json'
+        cached = _read_cache(cache_file)
+        if not isinstance(cached, dict) or not isinstance(cached.get('text'), str):
+            cached = None
+        else:
+            if isinstance(cached.get('etag'), str):
+                headers['If-None-Match'] = cached['etag']
+            if isinstance(cached.get('last_modified'), str):
+                headers['If-Modified-Since'] = cached['last_modified']
+    spec_req: requests.Response = _get_session().get(url, allow_redirects=True, headers=headers)
+    if spec_req.status_code == 304 and cached is not None:
+        return cached['text']
     if not spec_req.ok:
         spec_req.raise_for_status()
+    etag = spec_req.headers.get('ETag')
+    last_modified = spec_req.headers.get('Last-Modified')
+    if cache_file is not None and (etag or last_modified):
+        _write_cache(cache_file, {'etag': etag, 'last_modified': last_modified,
+                                  'text': spec_req.text})
     return spec_req.text
 
 #def parse_spec(spec: str) -> Dict:
@@ -309,13 +396,20 @@ def get_specification(url: str) -> str:
     #pythonize_spec(data)
     #return data
 
-def get_specifications(root: str=ROOT_SPEC) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+def get_specifications(root: str=ROOT_SPEC, *,
+                       max_workers: int=16) -> Tuple[Dict[str, str], Dict[str, Exception]]:
     """Function traverses the tree of OID YAML specifications, and returns accessible YAML
     specifications and errors encountered during tree traversal.
 
     This function does not perform any validation of loaded specifications beoynd checks
     and transformations needed to parse the YAML to get links to child specifications.
 
+    Specifications are fetched concurrently, and child specifications are requested as
+    soon as their parent specification is loaded. Each specification is fetched only once,
+    even if it's linked from several places (or circularly). Returned dictionaries list
+    specifications in depth-first preorder of the specification tree (first occurrence
+    wins), regardless of the order in which fetches were completed.
+
     Returns tuple with two dictionaries:
       - First dictionary contains `url: spec_yaml` with all YAML specifications
         that were successfuly fetched.
@@ -324,33 +418,89 @@ def get_specifications(root: str=ROOT_SPEC) -> Tuple[Dict[str, str], Dict[str, E
 
     Arguments:
       root: URL to root specification where tree traversal should begin.
+      max_workers: Maximum number of specifications fetched at the same time.
     """
-    def load_tree(node: str) -> None:
+    def get_children(node: str, spec: str) -> List[str]:
         try:
-            spec = get_specification(node)
-            spec_map[node] = spec
-            data = yaml.safe_load(spec)
+            data = _load_yaml(spec)
         except Exception as exc:
             err_map[node] = exc
-            return
+            return []
         if ITEM_CHILDREN not in data:
             err_map[node] = Exception("Missing children specification")
-            return
+            return []
+        result: List[str] = []
         for i, child in enumerate(data[ITEM_CHILDREN]):
             if ITEM_NODE_SPEC not in child:
                 err_map[node] = Exception(f"Children {i} does not contain node-spec")
-                return
-            else:
-                if child[ITEM_NODE_SPEC].lower() not in ('leaf', 'private'):
-                    load_tree(child[ITEM_NODE_SPEC])
-
+                break
+            if child[ITEM_NODE_SPEC].lower() not in NODE_KEYWORDS:
+                result.append(child[ITEM_NODE_SPEC])
+        return result
 
     spec_map: Dict[str, str] = {}
     err_map: Dict[str, Exception] = {}
-    load_tree(ROOT_SPEC)
-    return (spec_map, err_map)
+    visited: Set[str] = {root}
+    children_of: Dict[str, List[str]] = {}
+    sessions: List[requests.Session] = []
+    def init_worker() -> None:
+        sessions.append(_get_session())
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, initializer=init_worker) as executor:
+            pending: Dict[Future, str] = {executor.submit(get_specification, root): root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    try:
+                        spec_map[node] = future.result()
+                    except Exception as exc:
+                        err_map[node] = exc
+                        continue
+                    children_of[node] = get_children(node, spec_map[node])
+                    for url in children_of[node]:
+                        if url not in visited:
+                            visited.add(url)
+                            pending[executor.submit(get_specification, url)] = url
+    finally:
+        for session in sessions:
+            session.close()
+    # Fetches complete in arbitrary order, return results in preorder of the tree
+    order: List[str] = []
+    seen: Set[str] = set()
+    stack: List[str] = [root]
+    while stack:
+        url = stack.pop()
+        if url not in seen:
+            seen.add(url)
+            order.append(url)
+            stack.extend(reversed(children_of.get(url, [])))
+    return ({url: spec_map[url] for url in order if url in spec_map},
+            {url: err_map[url] for url in order if url in err_map})
+
+def _parse_specification(spec: str, cache_dir: Optional[Path]) -> Dict:
+    """Returns parsed, validated and pythonized OID specification.
 
-def parse_specifications(specifications: Dict) -> Tuple[Dict[str, Dict], Dict[str, Exception]]:
+    Arguments:
+      spec:      OID specification in YAML format.
+      cache_dir: Directory with on-disk cache of parsed specifications, or None.
+    """
+    cache_file: Optional[Path] = None
+    if cache_dir is not None:
+        cache_file = cache_dir / f'{_digest(spec).hex()}.json'
+        cached = _read_cache(cache_file)
+        if isinstance(cached, dict):
+            return cached
+    data: Dict = _load_yaml(spec)
+    validate_spec(data)
+    data = pythonize_spec(data)
+    if cache_file is not None:
+        _write_cache(cache_file, data)
+    return data
+
+def parse_specifications(specifications: Dict, *,
+                         discard_text: bool=False) -> Tuple[Dict[str, Dict], Dict[str, Exception]]:
     """Function that parses OID YAML specifications.
 
     Returns tuple with two dictionaries:
@@ -359,18 +509,28 @@ def parse_specifications(specifications: Dict) -> Tuple[Dict[str, Dict], Dict[st
       - Second dictionary contains `url: Exception` with errors encountered during parsing
         and validation.
 
+    When `FIREBIRD_UUID_CACHE` environment variable is set to `1`, parsed specifications
+    are cached on disk (in `$XDG_CACHE_HOME/firebird-uuid/<package version>`, with
+    `~/.cache` used when `XDG_CACHE_HOME` is not set), so unchanged specifications are not
+    parsed and validated again by subsequent runs.
+
     Arguments:
       specifications: Dictionary with YAML specifications returned by
         `.get_all_specifications()` function.
+      discard_text: When True, successfuly parsed specifications are removed from
+        `specifications` (and from the cache of parsed YAML documents), so their YAML
+        text and raw parsed data could be released right away.
     """
     data_map: Dict[str, Dict] = {}
     err_map: Dict[str, Exception] = {}
-    for url, spec in specifications.items():
+    cache_dir = _get_cache_dir()
+    for url, spec in list(specifications.items()):
         try:
-            data: Dict = yaml.safe_load(spec)
-            validate_spec(data)
-            data = pythonize_spec(data)
-            data_map[url] = data
+            data_map[url] = _parse_specification(spec, cache_dir)
         except Exception as exc:
             err_map[url] = exc
+        else:
+            if discard_text:
+                del specifications[url]
+                _forget_yaml(spec)
     return (data_map, err_map)
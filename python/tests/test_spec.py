@@ -0,0 +1,230 @@
+#coding:utf-8
+
+"""
+ID:          test-spec
+TITLE:       OID specifications
+DESCRIPTION: Parsing and traversal of OID YAML specifications
+NOTES:
+"""
+
+import json
+import time
+from unittest import mock
+import pytest
+import requests
+from firebird.uuid import get_specifications, parse_specifications, clear_parse_cache
+from firebird.uuid import _spec
+from firebird.uuid._spec import pythonize
+
+NODE_YAML = """node:
+    oid: '1.3.6.1.4.1.53446'
+    name: firebird
+    description: Firebird Project
+    contact: Contact
+    email: admin@firebirdsql.org
+    site: https://firebirdsql.org
+    parent-spec: ''
+    type: root
+"""
+
+CHILD_YAML = """    - number: {number}
+      name: {name}
+      description: Child node
+      contact: Contact
+      email: admin@firebirdsql.org
+      site: https://firebirdsql.org
+      node-spec: {node_spec}
+"""
+
+def test_pythonize():
+    data = {'name': 'x', 'type': 'root', 'parent-spec': 'url'}
+    result = pythonize(data)
+    assert result == {'name': 'x', 'parent_spec': 'url', 'node_type': 'root'}
+    assert list(result)[-1] == 'node_type'
+
+def test_parse_specifications_with_children():
+    spec = (NODE_YAML + 'children:\n'
+            + CHILD_YAML.format(number=1, name='leaf', node_spec='leaf')
+            + CHILD_YAML.format(number=2, name='private', node_spec='private'))
+    data_map, err_map = parse_specifications({'url': spec})
+    assert err_map == {}
+    data = data_map['url']
+    assert data['node']['oid'] == '1.3.6.1.4.1.53446'
+    assert data['node']['parent_spec'] == ''
+    assert data['node']['node_type'] == 'root'
+    assert [child['number'] for child in data['children']] == [1, 2]
+    assert [child['node_spec'] for child in data['children']] == ['leaf', 'private']
+
+def write_spec(path, *children):
+    """Writes specification with children linked to given paths (or keywords) and
+    returns its file:// URL."""
+    lines = [NODE_YAML, 'children:\n']
+    for i, child in enumerate(children, 1):
+        node_spec = child if isinstance(child, str) else child.as_uri()
+        lines.append(CHILD_YAML.format(number=i, name=f'child{i}', node_spec=node_spec))
+    path.write_text(''.join(lines), encoding='utf-8')
+    return path.as_uri()
+
+@pytest.fixture
+def fetch_log():
+    calls = []
+    original = _spec.get_specification
+    def get_specification(url):
+        calls.append(url)
+        return original(url)
+    with mock.patch.object(_spec, 'get_specification', side_effect=get_specification):
+        yield calls
+
+def test_get_specifications_diamond(tmp_path, fetch_log):
+    root, a, b, c = (tmp_path / f'{name}.oid' for name in 'rabc')
+    write_spec(c, 'leaf')
+    write_spec(a, c)
+    write_spec(b, c)
+    root_url = write_spec(root, a, b, 'private')
+    spec_map, err_map = get_specifications(root_url)
+    assert err_map == {}
+    assert list(spec_map) == [root_url, a.as_uri(), c.as_uri(), b.as_uri()]
+    assert sorted(fetch_log) == sorted(spec_map)
+
+@pytest.mark.parametrize('slow', ['a', 'b'])
+def test_get_specifications_order(tmp_path, slow):
+    paths = {name: tmp_path / f'{name}.oid' for name in ('r', 'a', 'b', 'a1', 'b1')}
+    write_spec(paths['a1'], 'leaf')
+    write_spec(paths['b1'], 'leaf')
+    write_spec(paths['a'], paths['a1'])
+    write_spec(paths['b'], paths['b1'])
+    root_url = write_spec(paths['r'], paths['a'], paths['b'])
+    original = _spec.get_specification
+    def get_specification(url):
+        if url == paths[slow].as_uri():
+            time.sleep(0.2)
+        return original(url)
+    with mock.patch.object(_spec, 'get_specification', side_effect=get_specification):
+        spec_map, err_map = get_specifications(root_url)
+    assert err_map == {}
+    assert list(spec_map) == [paths[name].as_uri() for name in ('r', 'a', 'a1', 'b', 'b1')]
+
+def test_get_specifications_cycle(tmp_path, fetch_log):
+    root, a = tmp_path / 'r.oid', tmp_path / 'a.oid'
+    write_spec(a, root)
+    root_url = write_spec(root, a)
+    spec_map, err_map = get_specifications(root_url)
+    assert err_map == {}
+    assert list(spec_map) == [root_url, a.as_uri()]
+    assert len(fetch_log) == 2
+
+def test_get_specifications_errors(tmp_path):
+    root, bad_yaml, no_spec = (tmp_path / f'{name}.oid' for name in ('r', 'yaml', 'nospec'))
+    missing = tmp_path / 'missing.oid'
+    bad_yaml.write_text('children: [', encoding='utf-8')
+    no_spec.write_text('children:\n    - number: 1\n', encoding='utf-8')
+    root_url = write_spec(root, missing, bad_yaml, no_spec)
+    spec_map, err_map = get_specifications(root_url)
+    assert list(spec_map) == [root_url, bad_yaml.as_uri(), no_spec.as_uri()]
+    assert list(err_map) == [missing.as_uri(), bad_yaml.as_uri(), no_spec.as_uri()]
+    assert isinstance(err_map[missing.as_uri()], OSError)
+    assert str(err_map[no_spec.as_uri()]) == 'Children 0 does not contain node-spec'
+
+SPEC_URL = 'https://example.org/spec.oid'
+LAST_MODIFIED = 'Wed, 01 Jan 2025 00:00:00 GMT'
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    monkeypatch.setenv('FIREBIRD_UUID_CACHE', '1')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    return _spec._get_cache_dir()
+
+def make_response(status_code, text='', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode('utf-8')
+    response.encoding = 'utf-8'
+    response.headers.update(headers or {})
+    return response
+
+def http_cache_file(cache_dir):
+    return cache_dir / 'http' / f'{_spec._digest(SPEC_URL).hex()}.json'
+
+@pytest.fixture
+def session():
+    session = mock.Mock()
+    with mock.patch.object(_spec, '_get_session', return_value=session):
+        yield session
+
+def test_get_specification_cache_stored(cache_env, session):
+    session.get.return_value = make_response(200, 'spec: 1', {'ETag': '"v1"',
+                                                               'Last-Modified': LAST_MODIFIED})
+    assert _spec.get_specification(SPEC_URL) == 'spec: 1'
+    assert json.loads(http_cache_file(cache_env).read_text(encoding='utf-8')) == \
+           {'etag': '"v1"', 'last_modified': LAST_MODIFIED, 'text': 'spec: 1'}
+
+def test_get_specification_not_modified(cache_env, session):
+    session.get.side_effect = [make_response(200, 'spec: 1', {'ETag': '"v1"',
+                                                              'Last-Modified': LAST_MODIFIED}),
+                               make_response(304)]
+    assert _spec.get_specification(SPEC_URL) == 'spec: 1'
+    assert _spec.get_specification(SPEC_URL) == 'spec: 1'
+    assert session.get.call_args_list[0].kwargs['headers'] == {}
+    assert session.get.call_args_list[1].kwargs['headers'] == {'If-None-Match': '"v1"',
+                                                               'If-Modified-Since': LAST_MODIFIED}
+
+def test_get_specification_not_cached_without_validators(cache_env, session):
+    session.get.side_effect = [make_response(200, 'spec: 1'), make_response(200, 'spec: 2')]
+    assert _spec.get_specification(SPEC_URL) == 'spec: 1'
+    assert not http_cache_file(cache_env).exists()
+    assert _spec.get_specification(SPEC_URL) == 'spec: 2'
+    assert session.get.call_args_list[1].kwargs['headers'] == {}
+
+@pytest.mark.parametrize('content', ['[1, 2]', '{"etag": "\\"v1\\""}', '{"etag": "\\"v1\\"", "text": 1}',
+                                     'not json'])
+def test_get_specification_malformed_cache(cache_env, session, content):
+    cache_file = http_cache_file(cache_env)
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text(content, encoding='utf-8')
+    session.get.return_value = make_response(200, 'spec: 2', {'ETag': '"v2"'})
+    assert _spec.get_specification(SPEC_URL) == 'spec: 2'
+    assert session.get.call_args.kwargs['headers'] == {}
+    assert json.loads(cache_file.read_text(encoding='utf-8'))['text'] == 'spec: 2'
+
+VALID_SPEC = NODE_YAML + 'children:\n' + CHILD_YAML.format(number=1, name='leaf', node_spec='leaf')
+
+def test_parse_specifications_disk_cache(cache_env):
+    data_map, err_map = parse_specifications({'url': VALID_SPEC})
+    assert err_map == {}
+    assert (cache_env / f'{_spec._digest(VALID_SPEC).hex()}.json').is_file()
+    with mock.patch.object(_spec, '_load_yaml') as load_yaml:
+        cached_map, err_map = parse_specifications({'url': VALID_SPEC})
+    load_yaml.assert_not_called()
+    assert err_map == {}
+    assert cached_map == data_map
+
+@pytest.mark.parametrize('content', ['not json', '[1, 2]'])
+def test_parse_specifications_disk_cache_corrupt(cache_env, content):
+    cache_file = cache_env / f'{_spec._digest(VALID_SPEC).hex()}.json'
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text(content, encoding='utf-8')
+    data_map, err_map = parse_specifications({'url': VALID_SPEC})
+    assert err_map == {}
+    assert data_map['url']['node']['name'] == 'firebird'
+    assert json.loads(cache_file.read_text(encoding='utf-8')) == data_map['url']
+
+def test_parse_specifications_discard_text(monkeypatch):
+    monkeypatch.delenv('FIREBIRD_UUID_CACHE', raising=False)
+    invalid_spec = NODE_YAML
+    _spec._load_yaml(VALID_SPEC)
+    assert _spec._digest(VALID_SPEC) in _spec._YAML_CACHE
+    specifications = {'valid': VALID_SPEC, 'invalid': invalid_spec}
+    data_map, err_map = parse_specifications(specifications, discard_text=True)
+    assert list(data_map) == ['valid']
+    assert list(err_map) == ['invalid']
+    assert specifications == {'invalid': invalid_spec}
+    assert _spec._digest(VALID_SPEC) not in _spec._YAML_CACHE
+
+def test_clear_parse_cache():
+    first = _spec._load_yaml(VALID_SPEC)
+    assert _spec._load_yaml(VALID_SPEC) is first
+    clear_parse_cache()
+    assert _spec._YAML_CACHE == {}
+    second = _spec._load_yaml(VALID_SPEC)
+    assert second is not first
+    assert second == first